@@ -12,6 +12,10 @@ from utils.tornado_utils import respond_error, redirect_relative, can_write_secu
 
 LOGGER = logging.getLogger('script_server.tornado_auth')
 
+# Current user is resolved multiple times per request, so it's cached in the request handler
+_CACHED_USER_ATTRIBUTE = '_tornado_auth_current_user'
+_NOT_CACHED = object()
+
 
 class TornadoAuth:
     def __init__(self, authenticator):
@@ -35,6 +39,14 @@ class TornadoAuth:
         return active
 
     def _get_current_user(self, request_handler):
+        username = getattr(request_handler, _CACHED_USER_ATTRIBUTE, _NOT_CACHED)
+        if username is _NOT_CACHED:
+            username = self._read_current_user(request_handler)
+            setattr(request_handler, _CACHED_USER_ATTRIBUTE, username)
+
+        return username
+
+    def _read_current_user(self, request_handler):
         cookie_username = tornado_utils.get_secure_cookie(request_handler, 'username')
         if cookie_username:
             return cookie_username
@@ -89,6 +101,7 @@ class TornadoAuth:
         LOGGER.info('Authenticated user ' + username)
 
         request_handler.set_secure_cookie('username', username, expires_days=self.authenticator.auth_expiration_days)
+        setattr(request_handler, _CACHED_USER_ATTRIBUTE, username)
 
         path = tornado.escape.url_unescape(request_handler.get_argument('next', '/'))
 
@@ -119,5 +132,6 @@ class TornadoAuth:
         LOGGER.info('Logging out ' + username)
 
         request_handler.clear_cookie('username')
+        setattr(request_handler, _CACHED_USER_ATTRIBUTE, None)
 
         self.authenticator.logout(username, request_handler)
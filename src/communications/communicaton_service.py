@@ -1,10 +1,14 @@
 import logging
-import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 
-_THREAD_PREFIX = 'CommunicationThread-'
+_THREAD_PREFIX = 'CommunicationThread'
+_MAX_SENDING_THREADS = 4
 
 LOGGER = logging.getLogger('script_server.communication_service')
 
+_send_pool = ThreadPoolExecutor(max_workers=_MAX_SENDING_THREADS, thread_name_prefix=_THREAD_PREFIX)
+_pending_sends = set()
+
 
 class CommunicationsService:
 
@@ -22,11 +26,10 @@ class CommunicationsService:
                 except:
                     LOGGER.exception('Could not send message to ' + str(destination))
 
-        thread = threading.Thread(target=_send, name=_THREAD_PREFIX + title)
-        thread.start()
+        future = _send_pool.submit(_send)
+        _pending_sends.add(future)
+        future.add_done_callback(_pending_sends.discard)
 
     @staticmethod
     def _wait():
-        for thread in threading.enumerate():
-            if thread.name.startswith(_THREAD_PREFIX):
-                thread.join()
+        wait(list(_pending_sends))
@@ -3,6 +3,7 @@ import logging
 import os
 import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import NamedTuple, Optional
 
@@ -25,12 +26,30 @@ WORKING_DIR_FIELD = 'working_directory'
 
 LOGGER = logging.getLogger('config_service')
 
+_CONFIG_FILE_EXTENSIONS = frozenset(['.json', '.yaml'])
+
+# reading many uncached files one by one is bound by disk latency, so they are read in parallel
+_CONFIG_READ_WORKERS = 8
+_config_read_pool = ThreadPoolExecutor(max_workers=_CONFIG_READ_WORKERS, thread_name_prefix='config_reader')
+
+
 class ConfigSearchResult(NamedTuple):
     short_config: ShortConfig
     path: str
     config_object: any
 
 
+class _CachedConfigFile(NamedTuple):
+    signature: tuple
+    config_object: any
+    short_config: Optional[ShortConfig]
+
+
+def _get_file_signature(path):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
 def _script_name_to_file_name(script_name):
     filename = _escape_characters_in_filename(script_name)
     return filename + '.json'
@@ -48,6 +67,24 @@ def _preprocess_incoming_config(config):
     config['name'] = name.strip()
 
 
+def _list_config_files(folder, result):
+    try:
+        entries = os.scandir(folder)
+    except OSError:
+        return
+
+    with entries:
+        for entry in entries:
+            # Read config file from within directories too
+            if entry.is_dir(follow_symlinks=False):
+                _list_config_files(entry.path, result)
+                continue
+
+            # both extensions are 5 chars long, so only the suffix needs lowercasing
+            if (entry.name[-5:].lower() in _CONFIG_FILE_EXTENSIONS) and entry.is_file():
+                result.append(entry.path)
+
+
 def _create_archive_filename(filename):
     current_datetime = datetime.now()
     formatted_datetime = current_datetime.strftime('%Y%m%d%H%M%S')
@@ -69,6 +106,13 @@ class ConfigService:
         self._process_invoker = process_invoker
         self._group_scripts_by_folder = group_scripts_by_folder
 
+        # path -> _CachedConfigFile, validated by file modification time and size
+        self._config_files_cache = {}
+        # path -> signature of a file, which couldn't be parsed, so that it's not prefetched until changed
+        self._broken_config_signatures = {}
+        # script name -> config path, rebuilt on every full scan of the runners folder
+        self._config_paths_by_name = {}
+
         file_utils.prepare_folder(self._script_configs_folder)
         file_utils.prepare_folder(self._scripts_deleted_folder)
 
@@ -83,6 +127,8 @@ class ConfigService:
         (short_config, path, config_object) = search_result
 
         if config_object.get('name') is None:
+            # config_object is shared with the cache, so it shouldn't be modified
+            config_object = dict(config_object)
             config_object['name'] = short_config.name
 
         if not self._can_edit_script(user, short_config):
@@ -168,10 +214,11 @@ class ConfigService:
             f'Archiving script config "{name}" from {path} to {unique_archive_file_path}'
         )
         shutil.move(path, unique_archive_file_path)
+        self._config_files_cache.pop(path, None)
 
     def load_script_code(self, script_name, user):
         if not self._authorizer.can_edit_code(user.user_id):
-            logging.warning('User ' + str(user) + ' is not allowed to edit code')
+            LOGGER.warning('User ' + str(user) + ' is not allowed to edit code')
             raise InvalidAccessException('Code edit is not allowed for this user')
 
         config_wrapper = self.load_config(script_name, user)
@@ -211,6 +258,7 @@ class ConfigService:
         sorted_config = get_sorted_config(config)
         config_json = json.dumps(sorted_config, indent=2)
         file_utils.write_file(path, config_json)
+        self._config_files_cache.pop(path, None)
 
     def load_config_file(self, path, content):
         if path.endswith('.yaml'):
@@ -229,10 +277,9 @@ class ConfigService:
 
         has_admin_rights = self._authorizer.is_admin(user.user_id)
 
-        def load_script(path, content) -> Optional[ShortConfig]:
+        def load_script(path) -> Optional[ShortConfig]:
             try:
-                config_object = self.load_config_file(path, content)
-                short_config = self.read_short_config(config_object, path)
+                short_config = self._read_config_file(path).short_config
 
                 if short_config is None:
                     return None
@@ -274,24 +321,17 @@ class ConfigService:
             self._script_configs_folder)
 
     def _visit_script_configs(self, visitor):
-        configs_dir = self._script_configs_folder
-
-        files = []
-        # Read config file from within directories too
-        for _root, _dirs, _files in os.walk(configs_dir, topdown=True):
-            for name in _files:
-                files.append(os.path.join(_root, name))
-
-        configs = [file for file in files if file.lower().endswith(".json") or file.lower().endswith(".yaml")]
+        configs = []
+        _list_config_files(self._script_configs_folder, configs)
         configs.sort()
 
+        self._prefetch_config_files(configs)
+
         result = []
 
         for config_path in configs:
             try:
-                content = file_utils.read_file(config_path)
-
-                visit_result = visitor(config_path, content)
+                visit_result = visitor(config_path)
                 if visit_result is not None:
                     result.append(visit_result)
 
@@ -302,15 +342,96 @@ class ConfigService:
             except:
                 LOGGER.exception("Couldn't read the file: " + config_path)
 
+        existing_paths = set(configs)
+        for cached_path in list(self._config_files_cache.keys()):
+            if cached_path not in existing_paths:
+                # concurrent scans (e.g. from the scheduler thread) can evict the same path
+                self._config_files_cache.pop(cached_path, None)
+        for broken_path in list(self._broken_config_signatures.keys()):
+            if broken_path not in existing_paths:
+                self._broken_config_signatures.pop(broken_path, None)
+
+        paths_by_name = {}
+        for config_path in configs:
+            cached = self._config_files_cache.get(config_path)
+            if (cached is not None) and (cached.short_config is not None):
+                paths_by_name.setdefault(cached.short_config.name, config_path)
+        self._config_paths_by_name = paths_by_name
+
         return result
 
+    def _prefetch_config_files(self, paths):
+        not_cached = [path for path in paths
+                      if (path not in self._config_files_cache) and (not self._is_known_broken(path))]
+        if len(not_cached) < 2:
+            return
+
+        def read_quietly(path):
+            try:
+                self._read_config_file(path)
+            except Exception:
+                # will be reported, when the file is visited
+                pass
+
+        list(_config_read_pool.map(read_quietly, not_cached))
+
+    def _is_known_broken(self, path):
+        broken_signature = self._broken_config_signatures.get(path)
+        if broken_signature is None:
+            return False
+
+        try:
+            return _get_file_signature(path) == broken_signature
+        except OSError:
+            return False
+
+    def _read_config_file(self, path) -> _CachedConfigFile:
+        signature = _get_file_signature(path)
+
+        cached = self._config_files_cache.get(path)
+        if (cached is not None) and (cached.signature == signature):
+            return cached
+
+        try:
+            content = file_utils.read_file(path)
+            config_object = self.load_config_file(path, content)
+            short_config = self.read_short_config(config_object, path)
+        except Exception:
+            self._broken_config_signatures[path] = signature
+            raise
+
+        self._broken_config_signatures.pop(path, None)
+
+        cached = _CachedConfigFile(signature, config_object, short_config)
+        self._config_files_cache[path] = cached
+        return cached
+
+    def _find_indexed_config(self, name) -> Optional[ConfigSearchResult]:
+        path = self._config_paths_by_name.get(name)
+        if path is None:
+            return None
+
+        try:
+            (_, config_object, short_config) = self._read_config_file(path)
+        except Exception:
+            # the file was removed or broken, let the full scan handle it
+            return None
+
+        if (short_config is None) or (short_config.name != name):
+            return None
+
+        return ConfigSearchResult(short_config, path, config_object)
+
     def _find_config(self, name, user) -> Optional[ConfigSearchResult]:
+        indexed_config = self._find_indexed_config(name.strip())
+        if indexed_config is not None:
+            return indexed_config
+
         has_admin_rights = self._authorizer.is_admin(user.user_id)
 
-        def find_and_load(path: str, content):
+        def find_and_load(path: str):
             try:
-                config_object = self.load_config_file(path, content)
-                short_config = self.read_short_config(config_object, path)
+                (_, config_object, short_config) = self._read_config_file(path)
 
                 if short_config is None:
                     return None
@@ -341,7 +462,7 @@ class ConfigService:
     @staticmethod
     def _load_script_config(
             path,
-            content_or_json_dict,
+            config_object,
             user,
             parameter_values,
             skip_invalid_parameters,
@@ -349,12 +470,8 @@ class ConfigService:
             group_scripts_by_folder,
             script_configs_folder):
 
-        if isinstance(content_or_json_dict, str):
-            json_object = custom_json.loads(content_or_json_dict)
-        else:
-            json_object = content_or_json_dict
         config = script_config.ConfigModel(
-            json_object,
+            config_object,
             path,
             user.get_username(),
             user.get_audit_name(),
@@ -31,12 +31,17 @@ class ExecutionService:
         #   - either they are running
         #   - OR user haven't yet seen execution results
         self._active_executor_ids = set()
+        # ids stay here after the execution is forgotten, to tell them apart from unknown ids
+        self._finish_notified_ids = set()
 
         self._finish_listeners = []
         self._start_listeners = []
         self._env_vars = env_vars
 
     def get_active_executor(self, execution_id, user):
+        if self._is_forgotten(execution_id):
+            return None
+
         self.validate_execution_id(execution_id, user, only_active=False)
         if execution_id not in self._active_executor_ids:
             return None
@@ -71,18 +76,15 @@ class ExecutionService:
     def stop_script(self, execution_id, user):
         self.validate_execution_id(execution_id, user)
 
-        if execution_id in self._executors:
-            self._executors[execution_id].stop()
+        self._get_for_executor(execution_id, lambda e: e.stop())
 
     def kill_script(self, execution_id, user):
         self.validate_execution_id(execution_id, user)
 
-        if execution_id in self._executors:
-            self._executors[execution_id].kill()
+        self._get_for_executor(execution_id, lambda e: e.kill())
 
     def kill_script_by_system(self, execution_id):
-        if execution_id in self._executors:
-            self._executors[execution_id].kill()
+        self._get_for_executor(execution_id, lambda e: e.kill())
 
     def get_exit_code(self, execution_id):
         return self._get_for_executor(execution_id, lambda e: e.get_return_code())
@@ -219,6 +221,8 @@ class ExecutionService:
         executor.cleanup()
         self._active_executor_ids.remove(execution_id)
 
+        self._forget_execution(execution_id)
+
     def add_finish_listener(self, callback, execution_id=None):
         if execution_id is None:
             self._finish_listeners.append(callback)
@@ -242,8 +246,22 @@ class ExecutionService:
             def finished(self):
                 self_service._fire_execution_finished(execution_id, user)
 
+                self_service._finish_notified_ids.add(execution_id)
+                self_service._forget_execution(execution_id)
+
         executor.add_finish_listener(FinishListener())
 
+    def _forget_execution(self, execution_id):
+        # executions are kept until finish listeners are notified and the user has seen the results
+        if (execution_id in self._active_executor_ids) or (execution_id not in self._finish_notified_ids):
+            return
+
+        self._executors.pop(execution_id, None)
+        self._execution_infos.pop(execution_id, None)
+
+    def _is_forgotten(self, execution_id):
+        return (execution_id in self._finish_notified_ids) and (execution_id not in self._execution_infos)
+
     def _fire_execution_finished(self, execution_id, user):
         for callback in self._finish_listeners:
             try:
@@ -191,53 +191,59 @@ def build_command_args(param_values, config):
 
     for parameter in config.parameters:
         name = parameter.name
-        option_name = parameter.param
+
+        # most of the parameter fields are observable properties, so they are read only when needed
+        if name not in param_values:
+            continue
 
         if not parameter.pass_as.pass_as_argument():
             continue
 
-        if name in param_values:
-            value = param_values[name]
+        value = param_values[name]
+        option_name = parameter.param
 
-            if parameter.no_value:
-                if value is True and option_name:
-                    result.append(option_name)
+        if parameter.no_value:
+            if value is True and option_name:
+                result.append(option_name)
 
-            elif value:
+        elif value:
 
-                if option_name:
-                    if isinstance(value, list):
-                        if len(value) == 0:
-                            continue
+            if option_name:
+                same_arg_param = parameter.same_arg_param
 
-                        if parameter.multiselect_argument_type == 'argument_per_value':
-                            if parameter.same_arg_param:
-                                result.append(option_name + str(value[0]))
-                                result.extend(value[1:])
-                            else:
-                                result.append(option_name)
-                                result.extend(value)
-                        elif parameter.multiselect_argument_type == 'repeat_param_value':
-                            if parameter.same_arg_param:
-                                for el in value:
-                                    result.append(option_name + str(el))
-                            else:
-                                for el in value:
-                                    result.append(option_name)
-                                    result.append(el)
-                    else:
-                        if parameter.same_arg_param:
-                            result.append(option_name + str(value))
+                if isinstance(value, list):
+                    if len(value) == 0:
+                        continue
+
+                    multiselect_argument_type = parameter.multiselect_argument_type
+                    if multiselect_argument_type == 'argument_per_value':
+                        if same_arg_param:
+                            result.append(option_name + str(value[0]))
+                            result.extend(value[1:])
                         else:
                             result.append(option_name)
-                            result.append(value)
-
+                            result.extend(value)
+                    elif multiselect_argument_type == 'repeat_param_value':
+                        if same_arg_param:
+                            for el in value:
+                                result.append(option_name + str(el))
+                        else:
+                            for el in value:
+                                result.append(option_name)
+                                result.append(el)
                 else:
-                    if isinstance(value, list):
-                        result.extend(value)
+                    if same_arg_param:
+                        result.append(option_name + str(value))
                     else:
+                        result.append(option_name)
                         result.append(value)
 
+            else:
+                if isinstance(value, list):
+                    result.extend(value)
+                else:
+                    result.append(value)
+
     return result
 
 
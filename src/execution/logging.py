@@ -2,6 +2,7 @@
 import logging
 import os
 import re
+import threading
 from string import Template
 from typing import Optional
 
@@ -21,6 +22,9 @@ OUTPUT_STARTED_MARKER = '>>>>>  OUTPUT STARTED <<<<<'
 
 LOGGER = logging.getLogger('script_server.execution.logging')
 
+_LOG_BUFFER_SIZE = 64 * 1024
+_FLUSH_INTERVAL_SECONDS = 1
+
 
 class ScriptOutputLogger:
     def __init__(self, log_file_path, output_stream):
@@ -32,8 +36,12 @@ class ScriptOutputLogger:
         self.log_file = None
         self.close_callback = None
 
+        self._flush_lock = threading.Lock()
+        self._flush_timer = None
+
     def start(self):
         self._ensure_file_open()
+        self._flush()
 
         self.output_stream.subscribe(self)
 
@@ -42,7 +50,7 @@ class ScriptOutputLogger:
             return
 
         try:
-            self.log_file = open(self.log_file_path, 'wb')
+            self.log_file = open(self.log_file_path, 'wb', buffering=_LOG_BUFFER_SIZE)
         except:
             LOGGER.exception("Couldn't create a log file")
 
@@ -59,18 +67,49 @@ class ScriptOutputLogger:
         try:
             if text is not None:
                 self.log_file.write(text.encode(ENCODING))
-                self.log_file.flush()
+                self._schedule_flush()
         except:
             LOGGER.exception("Couldn't write to the log file")
 
+    # full buffer is flushed by the file itself, the timer makes sure, that the log is not stale for too long,
+    # even if the script doesn't write anything else
+    def _schedule_flush(self):
+        with self._flush_lock:
+            if (self._flush_timer is not None) or self.closed:
+                return
+
+            self._flush_timer = threading.Timer(_FLUSH_INTERVAL_SECONDS, self._flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _cancel_flush_timer(self):
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+    def _flush(self):
+        with self._flush_lock:
+            self._cancel_flush_timer()
+
+            if (not self.log_file) or self.closed:
+                return
+
+            try:
+                self.log_file.flush()
+            except:
+                LOGGER.exception("Couldn't flush the log file")
+
     def _close(self):
-        try:
-            if self.log_file:
-                self.log_file.close()
-        except:
-            LOGGER.exception("Couldn't close the log file")
+        with self._flush_lock:
+            self._cancel_flush_timer()
+
+            try:
+                if self.log_file:
+                    self.log_file.close()
+            except:
+                LOGGER.exception("Couldn't close the log file")
 
-        self.closed = True
+            self.closed = True
 
         if self.close_callback:
             self.close_callback()
@@ -1,13 +1,16 @@
+import codecs
+import io
 import logging
 import os
 import subprocess
-import time
 
 from execution import process_base
 from utils import os_utils
 
 LOGGER = logging.getLogger('script_server.process_popen')
 
+_READ_CHUNK_SIZE = 4096
+
 
 def prepare_cmd_for_win(command):
     shell = False
@@ -63,30 +66,22 @@ class POpenProcessWrapper(process_base.ProcessWrapper):
 
     def pipe_process_output(self):
         try:
-            while True:
-                finished = False
-                wait_new_output = False
-
-                if self.is_finished():
-                    data = self.process.stdout.read()
-
-                    finished = True
+            # read raw bytes, whatever is available, instead of waiting for each char in the text wrapper
+            stdout = self.process.stdout.buffer
+            decoder = codecs.getincrementaldecoder(self.process.stdout.encoding)(errors='replace')
+            decoder = io.IncrementalNewlineDecoder(decoder, translate=True)
 
-                else:
-                    data = self.process.stdout.read(1)
-
-                    if not data:
-                        wait_new_output = True
-
-                if data:
-                    output_text = data
+            while True:
+                chunk = stdout.read1(_READ_CHUNK_SIZE)
+                output_text = decoder.decode(chunk, final=not chunk)
+                if output_text:
                     self._write_script_output(output_text)
 
-                if finished:
+                if not chunk:
                     break
 
-                if wait_new_output:
-                    time.sleep(0.01)
+            # the process can close stdout and keep running, but the stream should close only after the exit
+            self.process.wait()
 
         except:
             self._write_script_output("Unexpected error occurred. Contact the administrator.")
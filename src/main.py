@@ -50,8 +50,15 @@ def get_secret(secret_file):
         if secret:
             return secret
 
-    secret = os.urandom(256)
-    file_utils.write_file(secret_file, secret, byte_content=True)
+    # HMAC-SHA256 gains nothing from keys longer than its 32-byte digest
+    secret = os.urandom(32)
+
+    file_utils.prepare_folder(os.path.dirname(secret_file))
+    # without O_BINARY Windows would translate \n bytes of the secret to \r\n
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    with os.fdopen(os.open(secret_file, flags, 0o600), 'wb') as file:
+        file.write(secret)
+
     return secret
 
 
@@ -78,7 +85,7 @@ def main():
         logging.config.dictConfig(log_config)
 
     server_version = tool_utils.get_server_version(project_path)
-    logging.info('Starting Script Server' + (', v' + server_version if server_version else ' (custom version)'))
+    LOGGER.info('Starting Script Server' + (', v' + server_version if server_version else ' (custom version)'))
 
     file_utils.prepare_folder(CONFIG_FOLDER)
     file_utils.prepare_folder(TEMP_FOLDER)
@@ -81,6 +81,7 @@ class ConfigModel:
 
         self.parameters = ObservableList()
         self.parameter_values = ObservableDict()
+        self._parameters_by_name = None
 
         self._original_config = config_object
         self._included_config_paths = TemplateProperty(read_list(config_object, 'include'),
@@ -150,7 +151,7 @@ class ConfigModel:
                 validation_error = parameter.validate_value(value_wrapper)
                 if validation_error:
                     if skip_invalid_parameters:
-                        logging.warning('Parameter ' + parameter.name + ' has invalid value, skipping')
+                        LOGGER.warning('Parameter ' + parameter.name + ' has invalid value, skipping')
                         value_wrapper = parameter.create_value_wrapper(parameter.normalize_user_value(None))
                     else:
                         self.parameter_values.set(original_values)
@@ -258,19 +259,24 @@ class ConfigModel:
                     continue
 
     def find_parameter(self, param_name) -> Optional[ParameterModel]:
-        for parameter in self.parameters:
-            if parameter.name == param_name:
-                return parameter
-        return None
+        if self._parameters_by_name is None:
+            parameters_by_name = {}
+            for parameter in self.parameters:
+                parameters_by_name.setdefault(parameter.name, parameter)
+            self._parameters_by_name = parameters_by_name
+
+        return self._parameters_by_name.get(param_name)
 
     def on_add(self, parameter, index):
+        self._parameters_by_name = None
+
         if self.schedulable and parameter.secure:
             LOGGER.warning(
                 'Disabling schedulable functionality, because parameter ' + parameter.str_name() + ' is secure')
             self.schedulable = False
 
     def on_remove(self, parameter):
-        pass
+        self._parameters_by_name = None
 
     def _validate_parameter_configs(self):
         for parameter in self.parameters:
@@ -322,12 +328,12 @@ class ConfigModel:
         error_message = 'Failed to load preload script for ' + self.name + ': '
 
         if not isinstance(config, dict):
-            logging.warning(error_message + 'should be dict')
+            LOGGER.warning(error_message + 'should be dict')
             return None
 
         script = config.get('script')
         if is_empty(script):
-            logging.warning(error_message + 'missing "script" field')
+            LOGGER.warning(error_message + 'missing "script" field')
             return
 
         try:
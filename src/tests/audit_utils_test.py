@@ -1,5 +1,7 @@
 import base64
+import socket
 import unittest
+from unittest import mock
 
 from tests.test_utils import mock_object
 from utils import audit_utils, os_utils
@@ -132,6 +134,55 @@ class TestGetAllAuditNames(unittest.TestCase):
             names)
 
 
+class TestResolveHostname(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        audit_utils._hostname_cache.clear()
+
+    def tearDown(self):
+        super().tearDown()
+        audit_utils._hostname_cache.clear()
+
+    def test_same_ip_resolved_once(self):
+        with mock.patch('socket.gethostbyaddr', return_value=('my-host', [], ['10.1.2.3'])) as gethostbyaddr:
+            names1 = audit_utils.get_all_audit_names(mock_request_handler(ip='10.1.2.3'))
+            names2 = audit_utils.get_all_audit_names(mock_request_handler(ip='10.1.2.3'))
+
+        self.assertEqual('my-host', names1['hostname'])
+        self.assertEqual('my-host', names2['hostname'])
+        gethostbyaddr.assert_called_once_with('10.1.2.3')
+
+    def test_resolve_again_after_ttl(self):
+        with mock.patch('time.monotonic', return_value=1000), \
+                mock.patch('socket.gethostbyaddr', return_value=('old-host', [], ['10.1.2.3'])):
+            audit_utils.get_all_audit_names(mock_request_handler(ip='10.1.2.3'))
+
+        with mock.patch('time.monotonic', return_value=1000 + audit_utils._HOSTNAME_CACHE_TTL_SECONDS), \
+                mock.patch('socket.gethostbyaddr', return_value=('new-host', [], ['10.1.2.3'])):
+            names = audit_utils.get_all_audit_names(mock_request_handler(ip='10.1.2.3'))
+
+        self.assertEqual('new-host', names['hostname'])
+
+    def test_failed_lookup_retried(self):
+        with mock.patch('socket.gethostbyaddr', side_effect=socket.herror('Host name lookup failure')):
+            names1 = audit_utils.get_all_audit_names(mock_request_handler(ip='10.1.2.3'))
+
+        with mock.patch('socket.gethostbyaddr', return_value=('my-host', [], ['10.1.2.3'])) as gethostbyaddr:
+            names2 = audit_utils.get_all_audit_names(mock_request_handler(ip='10.1.2.3'))
+
+        self.assertNotIn('hostname', names1)
+        self.assertEqual('my-host', names2['hostname'])
+        gethostbyaddr.assert_called_once_with('10.1.2.3')
+
+    def test_oldest_evicted_when_full(self):
+        with mock.patch('utils.audit_utils._HOSTNAME_CACHE_MAX_SIZE', 2), \
+                mock.patch('socket.gethostbyaddr', side_effect=lambda ip: ('host-' + ip, [], [ip])):
+            for ip in ['10.0.0.1', '10.0.0.2', '10.0.0.3']:
+                audit_utils.get_all_audit_names(mock_request_handler(ip=ip))
+
+        self.assertEqual(['10.0.0.2', '10.0.0.3'], list(audit_utils._hostname_cache.keys()))
+
+
 class TestGetAuditUsername(unittest.TestCase):
     def test_auth_username(self):
         username = get_audit_username({'auth_username': 'user_X', 'ip': '123'})
@@ -5,6 +5,7 @@ import tempfile
 import unittest
 from collections import OrderedDict
 from shutil import copyfile
+from unittest import mock
 
 from parameterized import parameterized
 from tornado.httputil import HTTPFile
@@ -98,6 +99,69 @@ class ConfigServiceTest(unittest.TestCase):
         configs = self.config_service.list_configs(self.user)
         self.assertEqual([], configs)
 
+    def test_list_configs_when_file_unchanged_then_not_reread(self):
+        _create_script_config_file('conf_x')
+        self.config_service.list_configs(self.user)
+
+        with mock.patch('utils.file_utils.read_file') as read_file_mock:
+            configs = self.config_service.list_configs(self.user)
+
+        read_file_mock.assert_not_called()
+        self.assertEqual(['conf_x'], [c.name for c in configs])
+
+    def test_list_configs_when_not_cached_then_each_file_read_once(self):
+        for name in ['conf_x', 'conf_y', 'conf_z']:
+            _create_script_config_file(name)
+
+        with mock.patch('utils.file_utils.read_file', wraps=file_utils.read_file) as read_file_mock:
+            configs = self.config_service.list_configs(self.user)
+
+        self.assertCountEqual(['conf_x', 'conf_y', 'conf_z'], [c.name for c in configs])
+        self.assertEqual(3, read_file_mock.call_count)
+
+    def test_list_configs_when_broken_unchanged_then_parsed_once_per_scan(self):
+        _create_script_config_file('correct')
+        for name in ['broken_x', 'broken_y']:
+            file_utils.write_file(_create_script_config_file(name), '{ hello ?')
+        self.config_service.list_configs(self.user)
+
+        with mock.patch.object(self.config_service, 'load_config_file',
+                               wraps=self.config_service.load_config_file) as load_mock:
+            configs = self.config_service.list_configs(self.user)
+
+        self.assertEqual(['broken_x', 'broken_y', 'correct'], [c.name for c in configs])
+        self.assertEqual(2, load_mock.call_count)
+
+    def test_list_configs_when_broken_fixed(self):
+        broken_path = _create_script_config_file('broken_x')
+        file_utils.write_file(broken_path, '{ hello ?')
+        _create_script_config_file('conf_y')
+        self.config_service.list_configs(self.user)
+
+        file_utils.write_file(broken_path, json.dumps({'name': 'fixed_x', 'script_path': 'echo 123'}))
+
+        configs = self.config_service.list_configs(self.user)
+        self.assertEqual(['fixed_x', 'conf_y'], [c.name for c in configs])
+
+    def test_list_configs_when_file_changed(self):
+        path = _create_script_config_file('conf_x')
+        self.config_service.list_configs(self.user)
+
+        file_utils.write_file(path, json.dumps({'name': 'renamed conf_x', 'script_path': 'echo 123'}))
+
+        configs = self.config_service.list_configs(self.user)
+        self.assertEqual(['renamed conf_x'], [c.name for c in configs])
+
+    def test_list_configs_when_file_deleted(self):
+        _create_script_config_file('conf_x')
+        path_y = _create_script_config_file('conf_y')
+        self.config_service.list_configs(self.user)
+
+        os.remove(path_y)
+
+        configs = self.config_service.list_configs(self.user)
+        self.assertEqual(['conf_x'], [c.name for c in configs])
+
     def test_load_config(self):
         _create_script_config_file('conf_x')
 
@@ -105,6 +169,28 @@ class ConfigServiceTest(unittest.TestCase):
         self.assertIsNotNone(config)
         self.assertEqual('conf_x', config.name)
 
+    def test_load_config_when_indexed_then_single_file_checked(self):
+        _create_script_config_file('conf_x')
+        _create_script_config_file('conf_y')
+        _create_script_config_file('conf_z')
+        self.config_service.list_configs(self.user)
+
+        service = self.config_service
+        with mock.patch.object(service, '_read_config_file', wraps=service._read_config_file) as read_mock:
+            config = service.load_config_model('conf_y', self.user)
+
+        self.assertEqual('conf_y', config.name)
+        read_mock.assert_called_once_with(os.path.join(test_utils.temp_folder, 'runners', 'conf_y.json'))
+
+    def test_load_config_when_indexed_and_renamed(self):
+        path = _create_script_config_file('conf_x')
+        self.config_service.list_configs(self.user)
+
+        file_utils.write_file(path, json.dumps({'name': 'conf_y', 'script_path': 'echo 123'}))
+
+        self.assertIsNone(self.config_service.load_config_model('conf_x', self.user))
+        self.assertEqual('conf_y', self.config_service.load_config_model('conf_y', self.user).name)
+
     def test_load_config_when_not_exists(self):
         _create_script_config_file('conf_x')
 
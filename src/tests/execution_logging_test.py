@@ -1,11 +1,13 @@
 import functools
 import inspect
 import os
+import time
 import traceback
 import unittest
 import uuid
 from datetime import datetime, timedelta
 from typing import Optional
+from unittest import mock
 
 from parameterized import parameterized
 
@@ -95,6 +97,57 @@ class TestScriptOutputLogging(unittest.TestCase):
 
         self.assertEqual(self.read_log(), 'some text\ranother text')
 
+    @mock.patch('execution.logging.threading.Timer')
+    def test_log_flushed_by_timer(self, timer_mock):
+        self.output_logger = self.create_logger()
+        self.output_logger.start()
+
+        self.output_stream.push('some text')
+        self.output_stream.push(' and more')
+        self.assertEqual(self.read_log(), '')
+
+        timer_mock.assert_called_once_with(1, self.output_logger._flush)
+        timer_mock.return_value.start.assert_called_once()
+
+        self.output_logger._flush()
+        self.assertEqual(self.read_log(), 'some text and more')
+
+    @mock.patch('execution.logging.threading.Timer')
+    def test_new_flush_scheduled_after_flushed(self, timer_mock):
+        self.output_logger = self.create_logger()
+        self.output_logger.start()
+
+        self.output_stream.push('some text')
+        self.output_logger._flush()
+        self.output_stream.push(' and more')
+
+        self.assertEqual(2, timer_mock.call_count)
+
+    @mock.patch('execution.logging.threading.Timer')
+    def test_flush_timer_cancelled_on_close(self, timer_mock):
+        self.output_logger = self.create_logger()
+        self.output_logger.start()
+
+        self.output_stream.push('some text')
+        self.output_stream.close()
+
+        timer_mock.return_value.cancel.assert_called_once()
+        self.assertEqual(self.read_log(), 'some text')
+
+    @mock.patch('execution.logging._FLUSH_INTERVAL_SECONDS', 0.01)
+    def test_log_flushed_when_output_stops(self):
+        self.output_logger = self.create_logger()
+        self.output_logger.start()
+
+        self.output_stream.push('some text')
+
+        for _ in range(200):
+            if self.read_log() == 'some text':
+                break
+            time.sleep(0.01)
+
+        self.assertEqual(self.read_log(), 'some text')
+
     def create_logger(self):
         self.file_path = os.path.join(test_utils.temp_folder, 'TestScriptOutputLogging.log')
 
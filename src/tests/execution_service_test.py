@@ -13,6 +13,7 @@ from model.model_helper import AccessProhibitedException
 from tests import test_utils
 from tests.test_utils import mock_object, create_audit_names, _MockProcessWrapper, _IdGeneratorMock
 from utils import audit_utils
+from utils.exceptions.missing_arg_exception import MissingArgumentException
 
 DEFAULT_USER_ID = 'test_user'
 DEFAULT_AUDIT_NAMES = create_audit_names(auth_username=DEFAULT_USER_ID)
@@ -120,6 +121,35 @@ class ExecutionServiceTest(unittest.TestCase):
         self.assertFalse(execution_service.is_active(execution_id))
         self.assertIsNone(execution_service.get_active_executor(execution_id, DEFAULT_USER))
 
+    def test_active_executor_when_unknown_id(self):
+        execution_service = self.create_execution_service()
+
+        self.assertRaises(AccessProhibitedException, execution_service.get_active_executor, '999', DEFAULT_USER)
+
+    def test_active_executor_when_empty_id(self):
+        execution_service = self.create_execution_service()
+
+        self.assertRaises(MissingArgumentException, execution_service.get_active_executor, '', DEFAULT_USER)
+
+    def test_execution_forgotten_after_finish_and_cleanup(self):
+        execution_service = self.create_execution_service()
+        execution_id = self._start(execution_service)
+
+        self.get_process(execution_id).stop()
+        execution_service.cleanup_execution(execution_id, DEFAULT_USER)
+
+        self.assertIsNone(execution_service.get_owner(execution_id))
+        self.assertIsNone(execution_service.get_exit_code(execution_id))
+
+    def test_execution_kept_after_finish_without_cleanup(self):
+        execution_service = self.create_execution_service()
+        execution_id = self._start(execution_service)
+
+        self.get_process(execution_id).stop()
+
+        self.assertEqual(DEFAULT_USER_ID, execution_service.get_owner(execution_id))
+        self.assertEqual(9, execution_service.get_exit_code(execution_id))
+
     def test_cleanup_fails_on_active_execution(self):
         execution_service = self.create_execution_service()
         id1 = self._start(execution_service)
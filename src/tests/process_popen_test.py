@@ -57,6 +57,20 @@ class TestExecution(unittest.TestCase):
 
         self.assertEqual('gültig\n läuft verändert für �ndern \nPr�fung gültig läuft ࠀ 𒀀!', output)
 
+    def test_output_closed_before_exit(self):
+        process_wrapper = POpenProcessWrapper(['sh', '-c', 'echo started; exec >&- 2>&-; sleep 0.3'], '.', {})
+
+        finished_on_close = []
+        process_wrapper.output_stream.subscribe_on_close(
+            lambda: finished_on_close.append(process_wrapper.is_finished()))
+
+        process_wrapper.start()
+
+        output = test_utils.wait_and_read(process_wrapper)
+
+        self.assertEqual('started\n', output)
+        self.assertEqual([True], finished_on_close)
+
 
 class TestPrepareForWindows(unittest.TestCase):
     def test_prepare_ping(self):
@@ -1,8 +1,11 @@
 import os
+import sys
+import time
 import unittest
 
 from tests import test_utils
 from utils import process_utils
+from utils.process_utils import ExecutionException
 
 
 class TestSplitCommand(unittest.TestCase):
@@ -25,6 +28,55 @@ class TestSplitCommand(unittest.TestCase):
 
         self.assertEqual(command_split, ['/usr/bin/python', 'test.py'])
 
+    def test_unquoted_command_with_extra_whitespaces_linux(self):
+        test_utils.set_linux()
+
+        command_split = process_utils.split_command(' /usr/bin/python  test.py \t--flag\n')
+
+        self.assertEqual(command_split, ['/usr/bin/python', 'test.py', '--flag'])
+
+    def test_command_with_tabs_only_linux(self):
+        test_utils.set_linux()
+
+        command_split = process_utils.split_command('/usr/bin/python\ttest.py')
+
+        self.assertEqual(command_split, ['/usr/bin/python', 'test.py'])
+
+    def test_quoted_args_linux(self):
+        test_utils.set_linux()
+
+        command_split = process_utils.split_command('/usr/bin/python "my script.py" \'a b\' "" --name="x y"z')
+
+        self.assertEqual(command_split, ['/usr/bin/python', 'my script.py', 'a b', '', '--name=x yz'])
+
+    def test_nested_quotes_linux(self):
+        test_utils.set_linux()
+
+        command_split = process_utils.split_command('echo "it\'s" \'say "hi"\'')
+
+        self.assertEqual(command_split, ['echo', "it's", 'say "hi"'])
+
+    def test_unbalanced_quotes_linux(self):
+        test_utils.set_linux()
+
+        self.assertRaises(ValueError, process_utils.split_command, 'echo "abc')
+
+    def test_unbalanced_quote_after_long_whitespace_linux(self):
+        test_utils.set_linux()
+
+        start_time = time.time()
+        self.assertRaises(ValueError, process_utils.split_command, ' ' * 50000 + '"')
+
+        # the words regex must not backtrack over the whitespace run (it took seconds before)
+        self.assertLess(time.time() - start_time, 1)
+
+    def test_unquoted_command_with_backslashes_win(self):
+        test_utils.set_win()
+
+        command_split = process_utils.split_command('c:\\tools\\run.exe  c:\\temp\\file.txt')
+
+        self.assertEqual(command_split, ['c:\\tools\\run.exe', 'c:\\temp\\file.txt'])
+
     def test_complex_command_win(self):
         test_utils.set_win()
 
@@ -102,8 +154,40 @@ class TestSplitCommand(unittest.TestCase):
 
         self.assertEqual([abs_file, '123'], command_split)
 
+    def test_expand_home_in_args_linux(self):
+        test_utils.set_linux()
+
+        command_split = process_utils.split_command('ls ~/docs a~b')
+
+        self.assertEqual(['ls', os.path.expanduser('~/docs'), 'a~b'], command_split)
+
     def setUp(self):
         test_utils.setup()
 
     def tearDown(self):
         test_utils.cleanup()
+
+
+class TestInvoke(unittest.TestCase):
+    def test_output(self):
+        output = test_utils.process_invoker.invoke([sys.executable, '-c', 'print("line1"); print("line2")'])
+        self.assertEqual('line1\nline2\n', output)
+
+    def test_translate_newlines(self):
+        output = test_utils.process_invoker.invoke(
+            [sys.executable, '-c', 'import sys; sys.stdout.buffer.write(b"a\\r\\nb\\rc")'])
+        self.assertEqual('a\nb\nc', output)
+
+    def test_stderr_when_success(self):
+        output = test_utils.process_invoker.invoke(
+            [sys.executable, '-c', 'import sys; sys.stderr.write("warning"); print("done")'])
+        self.assertEqual('done\n', output)
+
+    def test_failure(self):
+        with self.assertRaises(ExecutionException) as context:
+            test_utils.process_invoker.invoke(
+                [sys.executable, '-c', 'import sys; print("out"); sys.stderr.write("failed"); sys.exit(3)'])
+
+        self.assertEqual(3, context.exception.exit_code)
+        self.assertEqual('failed', context.exception.stderr)
+        self.assertEqual('out\n', context.exception.stdout)
@@ -332,6 +332,17 @@ class ConfigModelObserverTest(unittest.TestCase):
 
         self.assertEqual([('remove', param1)], observer.changes)
 
+    def test_find_parameter_after_parameters_changed(self):
+        config = _create_config_model('conf_x', parameters=[create_script_param_config('param1')])
+        param1 = config.find_parameter('param1')
+
+        param2 = create_parameter_model('param2')
+        config.parameters.append(param2)
+        config.parameters.remove(param1)
+
+        self.assertIsNone(config.find_parameter('param1'))
+        self.assertIs(param2, config.find_parameter('param2'))
+
     def _create_collection_observer(self):
         class _CollectionObserver:
             def __init__(self) -> None:
@@ -0,0 +1,125 @@
+import json
+import math
+from collections import OrderedDict
+from unittest import TestCase, mock, skipUnless
+
+from utils import custom_json
+
+_CONTENT_WITH_COMMENTS = '{\n' \
+                         '  // some comment\n' \
+                         '  "name": "äbc \\"quoted\\"",\n' \
+                         '    // another comment\n' \
+                         '  "values": [1, -2.5, null, true, "x"],\n' \
+                         '  "nested": {"url": "http://localhost", "empty": {}}\n' \
+                         '}'
+
+_PARSED_CONTENT = {'name': 'äbc "quoted"',
+                   'values': [1, -2.5, None, True, 'x'],
+                   'nested': {'url': 'http://localhost', 'empty': {}}}
+
+_OBJECT = {'name': 'äbc "quoted"', 'values': [1, None, True], 'nested': {'x': 1.5}}
+
+_BIG_INTEGERS = [123456789012345678901234567890, 18446744073709551616, -9223372036854775809]
+
+
+class TestLoads(TestCase):
+    def test_simple_object(self):
+        self.assertEqual({'name': 'abc', 'values': [1, 2]}, custom_json.loads('{"name": "abc", "values": [1, 2]}'))
+
+    def test_comment_lines(self):
+        content = '{\n' \
+                  '  // some comment\n' \
+                  '  "name": "abc",\n' \
+                  '    // another comment\n' \
+                  '  "url": "http://localhost"\n' \
+                  '}'
+        self.assertEqual({'name': 'abc', 'url': 'http://localhost'}, custom_json.loads(content))
+
+    def test_object_pairs_hook(self):
+        result = custom_json.loads('{"b": 1, "a": 2}', object_pairs_hook=OrderedDict)
+
+        self.assertIsInstance(result, OrderedDict)
+        self.assertEqual(['b', 'a'], list(result.keys()))
+
+
+class TestDumpsBytes(TestCase):
+    def test_dumps_and_loads(self):
+        self.assertEqual(_OBJECT, custom_json.loads(custom_json.dumps_bytes(_OBJECT).decode('utf-8')))
+
+    def test_utf8_bytes(self):
+        obj = {'name': 'äbc', 'values': [1, 2]}
+        result = custom_json.dumps_bytes(obj)
+
+        self.assertIsInstance(result, bytes)
+        self.assertEqual(obj, json.loads(result.decode('utf-8')))
+
+
+@mock.patch('utils.custom_json.orjson', None)
+class TestWithoutOrjson(TestCase):
+    def test_loads(self):
+        self.assertEqual(_PARSED_CONTENT, custom_json.loads(_CONTENT_WITH_COMMENTS))
+
+    def test_dumps_bytes(self):
+        self.assertEqual(json.dumps(_OBJECT).encode('utf-8'), custom_json.dumps_bytes(_OBJECT))
+
+    def test_dumps_bytes_non_str_keys(self):
+        self.assertEqual({'1': 'a'}, json.loads(custom_json.dumps_bytes({1: 'a'})))
+
+    def test_loads_big_integers(self):
+        self.assertEqual(_BIG_INTEGERS, custom_json.loads(json.dumps(_BIG_INTEGERS)))
+
+    def test_loads_nan_and_infinity(self):
+        values = custom_json.loads('[NaN, Infinity, -Infinity]')
+
+        self.assertTrue(math.isnan(values[0]))
+        self.assertEqual([math.inf, -math.inf], values[1:])
+
+    def test_loads_invalid_json(self):
+        self.assertRaises(json.JSONDecodeError, custom_json.loads, '{"a": }')
+
+    def test_dumps_bytes_big_integers(self):
+        self.assertEqual(_BIG_INTEGERS, json.loads(custom_json.dumps_bytes({'values': _BIG_INTEGERS}))['values'])
+
+    def test_dumps_bytes_unsupported_keys(self):
+        self.assertRaises(TypeError, custom_json.dumps_bytes, {(1, 2): 'a'})
+
+
+@skipUnless(custom_json.orjson, 'orjson is not installed')
+class TestWithOrjson(TestCase):
+    def test_loads(self):
+        self.assertEqual(_PARSED_CONTENT, custom_json.loads(_CONTENT_WITH_COMMENTS))
+
+    def test_loads_uses_orjson(self):
+        with mock.patch('utils.custom_json.orjson.loads', wraps=custom_json.orjson.loads) as loads_mock:
+            custom_json.loads(_CONTENT_WITH_COMMENTS)
+
+        loads_mock.assert_called_once()
+
+    def test_loads_with_args_uses_json(self):
+        result = custom_json.loads('{"b": 1, "a": 2}', object_pairs_hook=OrderedDict)
+
+        self.assertIsInstance(result, OrderedDict)
+
+    def test_dumps_bytes(self):
+        self.assertEqual(_OBJECT, json.loads(custom_json.dumps_bytes(_OBJECT)))
+
+    def test_dumps_bytes_non_str_keys(self):
+        self.assertEqual({'1': 'a', '2.5': 'b'}, json.loads(custom_json.dumps_bytes({1: 'a', 2.5: 'b'})))
+
+    def test_loads_big_integers(self):
+        self.assertEqual(_BIG_INTEGERS, custom_json.loads(json.dumps(_BIG_INTEGERS)))
+
+    def test_loads_nan_and_infinity(self):
+        values = custom_json.loads('[NaN, Infinity, -Infinity]')
+
+        self.assertTrue(math.isnan(values[0]))
+        self.assertEqual([math.inf, -math.inf], values[1:])
+
+    def test_loads_invalid_json(self):
+        self.assertRaises(json.JSONDecodeError, custom_json.loads, '{"a": }')
+
+    def test_dumps_bytes_big_integers(self):
+        self.assertEqual(_BIG_INTEGERS, json.loads(custom_json.dumps_bytes({'values': _BIG_INTEGERS}))['values'])
+
+    def test_dumps_bytes_unsupported_keys(self):
+        self.assertRaises(TypeError, custom_json.dumps_bytes, {(1, 2): 'a'})
@@ -0,0 +1,73 @@
+from unittest import TestCase
+
+from utils import string_utils
+
+
+class TestReplace(TestCase):
+    def test_replace_in_the_middle(self):
+        self.assertEqual('abXYZef', string_utils.replace('abcdef', 'XYZ', 2, 3))
+
+    def test_replace_at_the_start(self):
+        self.assertEqual('Xcdef', string_utils.replace('abcdef', 'X', 0, 1))
+
+    def test_replace_at_the_end(self):
+        self.assertEqual('abcdX', string_utils.replace('abcdef', 'X', 4, 5))
+
+    def test_replace_whole_text(self):
+        self.assertEqual('X', string_utils.replace('abcdef', 'X', 0, 5))
+
+
+class TestUnwrapQuotes(TestCase):
+    def test_double_quotes(self):
+        self.assertEqual('abc', string_utils.unwrap_quotes('"abc"'))
+
+    def test_single_quotes(self):
+        self.assertEqual('abc', string_utils.unwrap_quotes("'abc'"))
+
+    def test_nested_quotes(self):
+        self.assertEqual('abc', string_utils.unwrap_quotes('"\'"abc"\'"'))
+
+    def test_mismatched_quotes(self):
+        self.assertEqual('"abc\'', string_utils.unwrap_quotes('"abc\''))
+
+    def test_quote_only_at_start(self):
+        self.assertEqual('"abc', string_utils.unwrap_quotes('"abc'))
+
+    def test_single_quote_char(self):
+        self.assertEqual('', string_utils.unwrap_quotes('"'))
+
+    def test_empty_string(self):
+        self.assertEqual('', string_utils.unwrap_quotes(''))
+
+
+class TestIsInteger(TestCase):
+    def test_positive(self):
+        self.assertTrue(string_utils.is_integer('123'))
+
+    def test_signed(self):
+        self.assertTrue(string_utils.is_integer('-5'))
+        self.assertTrue(string_utils.is_integer('+5'))
+
+    def test_surrounding_whitespace(self):
+        self.assertTrue(string_utils.is_integer(' 42\n'))
+
+    def test_digit_separators(self):
+        self.assertTrue(string_utils.is_integer('1_000'))
+
+    def test_invalid_digit_separators(self):
+        self.assertFalse(string_utils.is_integer('1__000'))
+
+    def test_empty(self):
+        self.assertFalse(string_utils.is_integer(''))
+
+    def test_sign_only(self):
+        self.assertFalse(string_utils.is_integer('-'))
+
+    def test_float(self):
+        self.assertFalse(string_utils.is_integer('1.5'))
+
+    def test_superscript_digit(self):
+        self.assertFalse(string_utils.is_integer('2²'))
+
+    def test_text(self):
+        self.assertFalse(string_utils.is_integer('abc'))
@@ -353,3 +353,77 @@ class ServerTest(TestCase):
         self.ioloop_thread.join(timeout=50)
         io_loop.close()
         set_event_loop_policy(None)
+
+
+class ScriptStreamSocketWriteTest(TestCase):
+    def test_join_adjacent_output(self):
+        self.socket.safe_write('output', 'abc')
+        self.socket.safe_write('output', 'def\n')
+        self.socket.safe_write('output', 'xyz')
+
+        self.flush()
+
+        self.assertEqual([b'{"event": "output", "data": "abcdef\\nxyz"}'], self.messages)
+
+    def test_keep_order_of_other_events(self):
+        self.socket.safe_write('output', 'abc')
+        self.socket.safe_write('file', {'url': 'result_files/x', 'filename': 'x'})
+        self.socket.safe_write('output', 'def')
+        self.socket.safe_write('output', 'ghi')
+        self.socket.safe_write('inline-image', {'output_path': 'img.png', 'download_url': 'result_files/img.png'})
+
+        self.flush()
+
+        self.assertEqual([
+            {'event': 'output', 'data': 'abc'},
+            {'event': 'file', 'data': {'url': 'result_files/x', 'filename': 'x'}},
+            {'event': 'output', 'data': 'defghi'},
+            {'event': 'inline-image', 'data': {'output_path': 'img.png', 'download_url': 'result_files/img.png'}},
+        ], [json.loads(message) for message in self.messages])
+
+    def test_schedule_single_flush_while_pending(self):
+        self.socket.safe_write('output', 'abc')
+        self.socket.safe_write('file', {'url': 'result_files/x', 'filename': 'x'})
+        self.socket.safe_write('output', 'def')
+
+        self.assertEqual(1, self.socket.ioloop.add_callback.call_count)
+
+    def test_schedule_new_flush_after_flushed(self):
+        self.socket.safe_write('output', 'abc')
+        self.flush()
+
+        self.socket.safe_write('output', 'def')
+        self.flush()
+
+        self.assertEqual(2, self.socket.ioloop.add_callback.call_count)
+        self.assertEqual([{'event': 'output', 'data': 'abc'}, {'event': 'output', 'data': 'def'}],
+                         [json.loads(message) for message in self.messages])
+
+    def test_ignore_when_connection_closed(self):
+        self.socket.ws_connection = None
+
+        self.socket.safe_write('output', 'abc')
+
+        self.socket.ioloop.add_callback.assert_not_called()
+        self.assertEqual([], self.messages)
+
+    def flush(self):
+        callbacks = [call.args[0] for call in self.socket.ioloop.add_callback.call_args_list[self.flushed_count:]]
+        self.flushed_count += len(callbacks)
+
+        for callback in callbacks:
+            callback()
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        with patch('tornado.websocket.WebSocketHandler.__init__', return_value=None):
+            self.socket = server.ScriptStreamSocket(MagicMock(), MagicMock())
+
+        self.socket.ws_connection = MagicMock()
+        self.socket.ioloop = MagicMock()
+
+        self.messages = []
+        self.socket.write_message = self.messages.append
+
+        self.flushed_count = 0
@@ -1,6 +1,7 @@
 import unittest
 
-from utils.tornado_utils import parse_header
+from tests.test_utils import mock_object
+from utils.tornado_utils import parse_header, get_request_body, get_full_url
 
 
 class TestParseHeader(unittest.TestCase):
@@ -43,3 +44,55 @@ class TestParseHeader(unittest.TestCase):
             'charset': 'UTF-8',
             'crossorigin': '',
             'boundary': 'something'}, subheaders)
+
+
+class TestGetRequestBody(unittest.TestCase):
+    def test_json_body(self):
+        body = get_request_body(self._create_handler('{"name": "äbc", "values": [1, 2]}'.encode('utf-8')))
+        self.assertEqual({'name': 'äbc', 'values': [1, 2]}, body)
+
+    def test_empty_body(self):
+        self.assertEqual({}, get_request_body(self._create_handler(b'')))
+
+    @staticmethod
+    def _create_handler(body):
+        handler = mock_object()
+        handler.request = mock_object()
+        handler.request.body = body
+        return handler
+
+
+class TestGetFullUrl(unittest.TestCase):
+    def test_absolute_path(self):
+        self.assertEqual('http://localhost:5000/login.html?next=%2Findex.html',
+                         get_full_url('/login.html?next=%2Findex.html', self._create_handler()))
+
+    def test_relative_path(self):
+        self.assertEqual('http://localhost:5000/index.html', get_full_url('index.html', self._create_handler()))
+
+    def test_path_with_dot_segments(self):
+        self.assertEqual('http://localhost:5000/index.html', get_full_url('/abc/../index.html', self._create_handler()))
+
+    def test_path_with_newline(self):
+        self.assertEqual('http://localhost:5000/ab', get_full_url('/a\nb', self._create_handler()))
+
+    def test_path_with_control_char(self):
+        self.assertEqual('http://localhost:5000/a\x1bb', get_full_url('/a\x1bb', self._create_handler()))
+
+    def test_path_with_empty_query(self):
+        self.assertEqual('http://localhost:5000/index.html', get_full_url('/index.html?', self._create_handler()))
+
+    def test_path_with_empty_query_and_fragment(self):
+        self.assertEqual('http://localhost:5000/index.html#x', get_full_url('/index.html?#x', self._create_handler()))
+
+    def test_path_with_empty_params(self):
+        self.assertEqual('http://localhost:5000/index.html?x=1',
+                         get_full_url('/index.html;?x=1', self._create_handler()))
+
+    @staticmethod
+    def _create_handler():
+        handler = mock_object()
+        handler.request = mock_object()
+        handler.request.protocol = 'http'
+        handler.request.host = 'localhost:5000'
+        return handler
@@ -0,0 +1,28 @@
+import json
+import unittest
+
+from web.web_utils import wrap_to_server_event
+
+
+class TestWrapToServerEvent(unittest.TestCase):
+    def test_output_event(self):
+        event = wrap_to_server_event('output', 'some text')
+        self.assertEqual({'event': 'output', 'data': 'some text'}, json.loads(event))
+
+    def test_output_event_with_special_characters(self):
+        text = 'line 1\n"quoted"\t\\ ünicode \x1b[31m'
+        event = wrap_to_server_event('output', text)
+        self.assertEqual({'event': 'output', 'data': text}, json.loads(event))
+
+    def test_output_event_when_not_text(self):
+        event = wrap_to_server_event('output', {'text': 'abc'})
+        self.assertEqual({'event': 'output', 'data': {'text': 'abc'}}, json.loads(event))
+
+    def test_other_event(self):
+        event = wrap_to_server_event('file', {'url': 'result_files/x', 'filename': 'x'})
+        self.assertEqual({'event': 'file', 'data': {'url': 'result_files/x', 'filename': 'x'}}, json.loads(event))
+
+    def test_event_is_utf8_bytes(self):
+        event = wrap_to_server_event('output', 'äbc')
+        self.assertIsInstance(event, bytes)
+        self.assertEqual({'event': 'output', 'data': 'äbc'}, json.loads(event.decode('utf-8')))
@@ -2,6 +2,8 @@ import base64
 import logging
 import socket
 import sys
+import threading
+import time
 
 from utils.collection_utils import get_first_existing
 from utils.tornado_utils import get_proxied_ip
@@ -15,6 +17,13 @@ AUTH_USERNAME = 'auth_username'
 
 LOGGER = logging.getLogger('script_server.audit_utils')
 
+# reverse DNS is blocking and can be slow, so resolved hostnames are reused for a while
+_HOSTNAME_CACHE_TTL_SECONDS = 300
+_HOSTNAME_CACHE_MAX_SIZE = 1024
+# ip -> (hostname, expiration time)
+_hostname_cache = {}
+_hostname_cache_lock = threading.Lock()
+
 
 def get_all_audit_names(request_handler):
     result = {}
@@ -46,13 +55,30 @@ def get_all_audit_names(request_handler):
 
 
 def _resolve_hostname(ip):
+    now = time.monotonic()
+
+    with _hostname_cache_lock:
+        cached = _hostname_cache.get(ip)
+    if (cached is not None) and (cached[1] > now):
+        return cached[0]
+
     try:
         (hostname, _, _) = socket.gethostbyaddr(ip)
-        return hostname
     except:
+        # failures are not cached, the resolver can be unavailable only temporarily
         LOGGER.warning('Could not get hostname for ' + ip)
         return None
 
+    with _hostname_cache_lock:
+        _hostname_cache.pop(ip, None)
+        if len(_hostname_cache) >= _HOSTNAME_CACHE_MAX_SIZE:
+            # dicts keep insertion order, so the oldest entry is the first one
+            del _hostname_cache[next(iter(_hostname_cache))]
+
+        _hostname_cache[ip] = (hostname, now + _HOSTNAME_CACHE_TTL_SECONDS)
+
+    return hostname
+
 
 def get_audit_name(all_audit_names):
     audit_types = [AUTH_USERNAME, PROXIED_USERNAME, PROXIED_HOSTNAME, PROXIED_IP, HOSTNAME, IP]
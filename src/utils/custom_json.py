@@ -1,9 +1,39 @@
 import json
 import re
 
-def loads (content, **args):
-    contents=''
-    for line in content.split('\n'):
-        if not re.match (r'\s*//.*', line):
-            contents += line + "\n"
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_COMMENT_LINE_PATTERN = re.compile(r'\s*//.*')
+
+# orjson silently parses integers beyond 64 bits as floats, so documents with long numbers are left to json
+_LONG_NUMBER_PATTERN = re.compile(r'\d{19,}')
+
+
+def loads(content, **args):
+    contents = ''.join(line + '\n'
+                       for line in content.split('\n')
+                       if not _COMMENT_LINE_PATTERN.match(line))
+
+    # orjson is an optional faster parser, it doesn't support json.loads arguments though
+    if (orjson is not None) and (not args) and (not _LONG_NUMBER_PATTERN.search(contents)):
+        try:
+            return orjson.loads(contents)
+        except orjson.JSONDecodeError:
+            # e.g. NaN or Infinity, which are accepted by json (or json raises the usual error)
+            pass
+
     return json.loads(contents, **args)
+
+
+def dumps_bytes(obj):
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # e.g. integers beyond 64 bits
+            pass
+
+    return json.dumps(obj).encode('utf-8')
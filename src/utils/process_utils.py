@@ -1,7 +1,11 @@
+import io
+import locale
 import logging
 import os
+import re
 import shlex
 import subprocess
+import sys
 
 from utils import file_utils
 from utils import os_utils
@@ -10,6 +14,21 @@ from utils.env_utils import EnvVariables
 
 LOGGER = logging.getLogger('script_server.process_utils')
 
+# bigger pipes let verbose commands write without stalling, until their output is read
+_PIPE_SIZE = 1024 * 1024
+# fcntl.F_SETPIPE_SZ is available only since python 3.10
+_F_SETPIPE_SZ = 1031
+
+# shlex.split treats only these chars as whitespace
+_SHLEX_WHITESPACE = ' \t\r\n'
+_SHLEX_WHITESPACE_PATTERN = re.compile('[' + _SHLEX_WHITESPACE + ']+')
+# a posix word without escapes: unquoted chars and quoted parts, glued together
+_POSIX_WORD = '(?:[^' + _SHLEX_WHITESPACE + '"\'\\\\]|"[^"]*"|\'[^\']*\')+'
+_POSIX_WORD_PATTERN = re.compile(_POSIX_WORD)
+_POSIX_WORDS_PATTERN = re.compile(
+    '[{ws}]*(?:{word}(?:[{ws}]+{word})*[{ws}]*)?'.format(ws=_SHLEX_WHITESPACE, word=_POSIX_WORD))
+_QUOTED_PART_PATTERN = re.compile('"([^"]*)"|\'([^\']*)\'')
+
 
 class ProcessInvoker:
 
@@ -28,28 +47,53 @@ class ProcessInvoker:
                              stderr=subprocess.PIPE,
                              cwd=work_dir,
                              env=env_vars,
-                             universal_newlines=True,
                              shell=shell)
 
+        _enlarge_pipes(p.stdout, p.stderr)
+
         (output, error) = p.communicate()
 
-        result_code = p.returncode
-        if result_code != 0:
-            raise ExecutionException(result_code, error, output)
+        return _check_result(p.returncode, output, error, check_stderr)
+
+
+# outputs are decoded only when needed: stderr text is used only for failed commands
+def _check_result(result_code, output_bytes, error_bytes, check_stderr):
+    if result_code != 0:
+        raise ExecutionException(result_code, _decode_output(error_bytes), _decode_output(output_bytes))
+
+    if error_bytes and check_stderr:
+        LOGGER.warning("Error output wasn't empty, although the command finished with code 0!")
+
+    return _decode_output(output_bytes)
+
+
+def _decode_output(data):
+    # the same decoding and newlines translation, as in Popen(universal_newlines=True)
+    return io.TextIOWrapper(io.BytesIO(data), encoding=locale.getpreferredencoding(False)).read()
+
 
-        if error and check_stderr:
-            LOGGER.warning("Error output wasn't empty, although the command finished with code 0!")
+def _enlarge_pipes(*pipes):
+    if not sys.platform.startswith('linux'):
+        return
 
-        return output
+    import fcntl
+    set_pipe_size = getattr(fcntl, 'F_SETPIPE_SZ', _F_SETPIPE_SZ)
+
+    for pipe in pipes:
+        try:
+            fcntl.fcntl(pipe.fileno(), set_pipe_size, _PIPE_SIZE)
+        except OSError:
+            # e.g. the size is above /proc/sys/fs/pipe-max-size for unprivileged users
+            pass
 
 
 def split_command(script_command, working_directory=None):
-    if ' ' in script_command:
+    if _SHLEX_WHITESPACE_PATTERN.search(script_command):
         if _is_file_path(script_command, working_directory):
             args = [script_command]
         else:
             posix = not os_utils.is_win()
-            args = shlex.split(script_command, posix=posix)
+            args = _split_args(script_command, posix)
 
             if not posix:
                 args = [string_utils.unwrap_quotes(arg) for arg in args]
@@ -57,16 +101,39 @@ def split_command(script_command, working_directory=None):
         args = [script_command]
 
     script_path = file_utils.normalize_path(args[0], working_directory)
-    if (not os.path.isabs(script_path)) or (not os.path.exists(script_path)):
-        script_path = args[0]
+    if os.path.isabs(script_path) and os.path.exists(script_path):
+        args[0] = script_path
+
+    # args is always a new list here, so it's safe to update it in place
+    for i in range(1, len(args)):
+        # expanduser never changes arguments, which don't start with ~
+        if args[i].startswith('~'):
+            args[i] = os.path.expanduser(args[i])
+
+    return args
+
+
+def _split_args(script_command, posix):
+    special_chars = ('"', "'", '\\') if posix else ('"', "'")
+
+    # commands without quotes and escapes are split the same way as shlex does, but much faster
+    if not any((char in script_command) for char in special_chars):
+        stripped_command = script_command.strip(_SHLEX_WHITESPACE)
+        if stripped_command:
+            return _SHLEX_WHITESPACE_PATTERN.split(stripped_command)
+
+    # quoted commands without escapes are also split like shlex does, unbalanced quotes are left to shlex
+    if posix and ('\\' not in script_command) and _POSIX_WORDS_PATTERN.fullmatch(script_command):
+        return [_unquote_posix_word(word) for word in _POSIX_WORD_PATTERN.findall(script_command)]
+
+    return shlex.split(script_command, posix=posix)
+
 
-    script_args = args[1:]
-    for i, body_arg in enumerate(script_args):
-        expanded = os.path.expanduser(body_arg)
-        if expanded != body_arg:
-            script_args[i] = expanded
+def _unquote_posix_word(word):
+    if ('"' not in word) and ("'" not in word):
+        return word
 
-    return [script_path] + script_args
+    return _QUOTED_PART_PATTERN.sub('\\1\\2', word)
 
 
 def _is_file_path(script_command_with_whitespaces, working_directory):
@@ -1,15 +1,22 @@
-def replace(old_text, new_text, start, end):
-    start_text = old_text[:start]
+_QUOTES = ('"', "'")
+_SIGNS = ('+', '-')
 
-    if end < (len(old_text) - 1):
-        end_text = old_text[end + 1:]
-    else:
-        end_text = ''
 
-    return start_text + new_text + end_text
+def replace(old_text, new_text, start, end):
+    return ''.join((old_text[:start], new_text, old_text[end + 1:]))
 
 
 def is_integer(text):
+    if isinstance(text, str):
+        stripped = text.strip()
+        digits = stripped[1:] if stripped[:1] in _SIGNS else stripped
+        if digits.isdecimal():
+            return True
+
+        # int() also accepts digit separators like 1_000, leave those to it
+        if '_' not in digits:
+            return False
+
     try:
         int(text)
         return True
@@ -18,10 +25,8 @@ def is_integer(text):
 
 
 def unwrap_quotes(string):
-    if string.startswith('"') and string.endswith('"'):
-        return unwrap_quotes(string[1:-1])
-    elif string.startswith("'") and string.endswith("'"):
-        return unwrap_quotes(string[1:-1])
+    while string and (string[0] == string[-1]) and (string[0] in _QUOTES):
+        string = string[1:-1]
 
     return string
 
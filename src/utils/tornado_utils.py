@@ -13,6 +13,10 @@ from model.model_helper import is_empty
 from utils import string_utils
 from utils.string_utils import unwrap_quotes
 
+# parts of an absolute path, which urljoin would change: control chars (it strips \t\r\n), dot segments
+# and empty params/query/fragment markers (e.g. trailing ? or ;#)
+_URLJOIN_CHANGED_PATH_PATTERN = re.compile(r'[\x00-\x1f\x7f]|/\.|[;?#]$|;[?#]|\?#')
+
 
 def respond_error(request_handler, status_code, message):
     request_handler.set_status(status_code)
@@ -43,6 +47,12 @@ def redirect(full_url, request_handler, *args, **kwargs):
 def get_full_url(relative_url, request_handler):
     request = request_handler.request
     host_url = request.protocol + '://' + request.host
+
+    # plain absolute paths don't need URL parsing, other forms are resolved by urljoin
+    if relative_url.startswith('/') and (not relative_url.startswith('//')) \
+            and (not _URLJOIN_CHANGED_PATH_PATTERN.search(relative_url)):
+        return host_url + relative_url
+
     return urljoin(host_url, relative_url)
 
 
@@ -76,10 +86,11 @@ def get_form_file(request_handler, argument_name):
 
 
 def get_request_body(request_handler):
-    raw_request_body = request_handler.request.body.decode('UTF-8')
+    raw_request_body = request_handler.request.body
     if is_empty(raw_request_body):
         return {}
 
+    # json decodes UTF-8 bytes itself, no need for an intermediate str
     return json.loads(raw_request_body)
 
 
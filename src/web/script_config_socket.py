@@ -96,10 +96,10 @@ class ScriptConfigSocket(tornado.websocket.WebSocketHandler):
                 return
             elif type == 'initialValues':
                 if not self.init_with_values:
-                    logging.warning('Received initial values, but not expected. Ignoring')
+                    LOGGER.warning('Received initial values, but not expected. Ignoring')
                     return
                 if self.config_model:
-                    logging.warning('Received initial values, but model is already initialized. Ignoring')
+                    LOGGER.warning('Received initial values, but model is already initialized. Ignoring')
                     return
                 parameter_values = data.get('parameterValues')
 
@@ -5,6 +5,7 @@ import logging.config
 import os
 import signal
 import ssl
+import threading
 import time
 import urllib
 from urllib.parse import urlencode
@@ -140,7 +141,7 @@ class GetScripts(BaseRequestHandler):
 
         scripts = [{'name': conf.name, 'group': conf.group, 'parsing_failed': conf.parsing_failed} for conf in configs]
 
-        self.write(json.dumps({'scripts': scripts}))
+        self.write(custom_json.dumps_bytes({'scripts': scripts}))
 
 
 class AdminUpdateScriptEndpoint(BaseRequestHandler):
@@ -152,10 +153,10 @@ class AdminUpdateScriptEndpoint(BaseRequestHandler):
         try:
             self.application.config_service.create_config(user, config, uploaded_script)
         except InvalidConfigException as e:
-            logging.warning('Failed to create script config', exc_info=True)
+            LOGGER.warning('Failed to create script config', exc_info=True)
             raise tornado.web.HTTPError(422, reason=str(e))
         except InvalidAccessException as e:
-            logging.warning('Failed to create script config', exc_info=True)
+            LOGGER.warning('Failed to create script config', exc_info=True)
             raise tornado.web.HTTPError(403, reason=str(e))
 
     @requires_admin_rights
@@ -263,6 +264,10 @@ class ScriptStreamSocket(tornado.websocket.WebSocketHandler):
 
         self.executor = None
 
+        # [event_type, data] pairs, which are not yet written to the socket
+        self._pending_events = []
+        self._pending_events_lock = threading.Lock()
+
     @check_authorization
     @inject_user
     def open(self, user, execution_id):
@@ -274,6 +279,10 @@ class ScriptStreamSocket(tornado.websocket.WebSocketHandler):
             self.handle_exception_on_open(e)
             return
 
+        if self.executor is None:
+            self.handle_exception_on_open(NotFoundException('No active executor found for id ' + execution_id))
+            return
+
         self.ioloop = tornado.ioloop.IOLoop.current()
 
         self.write_message(wrap_to_server_event('input', 'your input >>'))
@@ -281,7 +290,7 @@ class ScriptStreamSocket(tornado.websocket.WebSocketHandler):
         user_id = identify_user(self)
 
         output_stream = execution_service.get_raw_output_stream(execution_id, user_id)
-        pipe_output_to_http(output_stream, self.safe_write)
+        pipe_output_to_http(output_stream, lambda output: self.safe_write('output', output))
 
         file_download_feature = self.application.file_download_feature
         web_socket = self
@@ -294,9 +303,7 @@ class ScriptStreamSocket(tornado.websocket.WebSocketHandler):
                     filename = os.path.basename(file)
                     url_path = web_socket.prepare_download_url(file)
 
-                    web_socket.safe_write(wrap_to_server_event(
-                        'file',
-                        {'url': url_path, 'filename': filename}))
+                    web_socket.safe_write('file', {'url': url_path, 'filename': filename})
             except:
                 LOGGER.exception('Could not prepare downloadable files')
 
@@ -319,14 +326,42 @@ class ScriptStreamSocket(tornado.websocket.WebSocketHandler):
         audit_name = get_audit_name_from_request(self)
         LOGGER.info(audit_name + ' disconnected')
 
-    def safe_write(self, message):
-        if self.ws_connection is not None:
-            self.ioloop.add_callback(self.write_message, message)
+    def safe_write(self, event_type, data):
+        if self.ws_connection is None:
+            return
+
+        with self._pending_events_lock:
+            flush_scheduled = bool(self._pending_events)
+
+            if flush_scheduled and (event_type == 'output') and (self._pending_events[-1][0] == 'output'):
+                self._pending_events[-1][1].append(data)
+            elif event_type == 'output':
+                self._pending_events.append([event_type, [data]])
+            else:
+                self._pending_events.append([event_type, data])
+
+        if not flush_scheduled:
+            self.ioloop.add_callback(self._flush_pending_events)
+
+    def _flush_pending_events(self):
+        with self._pending_events_lock:
+            events = self._pending_events
+            self._pending_events = []
+
+        for event_type, data in events:
+            if self.ws_connection is None:
+                return
+
+            if event_type == 'output':
+                # adjacent output chunks are sent as a single message
+                data = ''.join(data)
+
+            self.write_message(wrap_to_server_event(event_type, data))
 
     def send_inline_image(self, original_path, download_path):
-        self.safe_write(wrap_to_server_event(
+        self.safe_write(
             'inline-image',
-            {'output_path': original_path, 'download_url': self.prepare_download_url(download_path)}))
+            {'output_path': original_path, 'download_url': self.prepare_download_url(download_path)})
 
     def prepare_download_url(self, file):
         downloads_folder = self.application.downloads_folder
@@ -459,7 +494,7 @@ class GetActiveExecutionIds(BaseRequestHandler):
 
         active_executions = execution_service.get_active_executions(user_id)
 
-        self.write(json.dumps(active_executions))
+        self.write(custom_json.dumps_bytes(active_executions))
 
 
 class GetExecutingScriptConfig(BaseRequestHandler):
@@ -690,7 +725,7 @@ class GetShortHistoryEntriesHandler(BaseRequestHandler):
                 running_script_ids.append(entry.id)
 
         short_logs = to_short_execution_log(history_entries, running_script_ids)
-        self.write(json.dumps(short_logs))
+        self.write(custom_json.dumps_bytes(short_logs))
 
 
 class GetLongHistoryEntryHandler(BaseRequestHandler):
@@ -717,7 +752,7 @@ class GetLongHistoryEntryHandler(BaseRequestHandler):
 
         running = self.application.execution_service.is_running(history_entry.id, user)
         long_log = to_long_execution_log(history_entry, log, running)
-        self.write(json.dumps(long_log))
+        self.write(custom_json.dumps_bytes(long_log))
 
 
 @tornado.web.stream_request_body
@@ -756,7 +791,7 @@ class AddSchedule(StreamUploadRequestHandler):
 def pipe_output_to_http(output_stream, write_callback):
     class OutputToHttpListener:
         def on_next(self, output):
-            write_callback(wrap_to_server_event('output', output))
+            write_callback(output)
 
         def on_close(self):
             pass
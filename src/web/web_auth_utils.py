@@ -14,7 +14,21 @@ from web.web_utils import identify_user
 
 LOGGER = logging.getLogger('web_server')
 
-webpack_prefixed_extensions = ['.css', '.js.map', '.js', '.jpg', '.woff', '.woff2', '.png']
+webpack_prefixed_extensions = frozenset(['.css', '.js.map', '.js', '.jpg', '.woff', '.woff2', '.png'])
+
+_LOGIN_RESOURCES = frozenset(['/js/login.js',
+                              '/js/login.js.map',
+                              '/js/chunk-login-vendors.js',
+                              '/js/chunk-login-vendors.js.map',
+                              '/favicon.ico',
+                              '/css/login.css',
+                              '/css/chunk-login-vendors.css',
+                              '/fonts/roboto-latin-500.woff2',
+                              '/fonts/roboto-latin-500.woff',
+                              '/fonts/roboto-latin-400.woff2',
+                              '/fonts/roboto-latin-400.woff',
+                              '/img/titleBackground_login.jpg',
+                              '/img/gitlab-icon-rgb.png'])
 
 
 def check_authorization_sync(func):
@@ -103,21 +117,7 @@ def is_allowed_during_login(request_path, login_url, request_handler):
         return True
     request_path = remove_webpack_suffixes(request_path)
 
-    login_resources = ['/js/login.js',
-                       '/js/login.js.map',
-                       '/js/chunk-login-vendors.js',
-                       '/js/chunk-login-vendors.js.map',
-                       '/favicon.ico',
-                       '/css/login.css',
-                       '/css/chunk-login-vendors.css',
-                       '/fonts/roboto-latin-500.woff2',
-                       '/fonts/roboto-latin-500.woff',
-                       '/fonts/roboto-latin-400.woff2',
-                       '/fonts/roboto-latin-400.woff',
-                       '/img/titleBackground_login.jpg',
-                       '/img/gitlab-icon-rgb.png']
-
-    return (request_path in login_resources) or (request_path.startswith('/theme/'))
+    return (request_path in _LOGIN_RESOURCES) or (request_path.startswith('/theme/'))
 
 
 def remove_webpack_suffixes(request_path):
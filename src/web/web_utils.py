@@ -1,12 +1,18 @@
-import json
 from itertools import chain
 
 from auth.user import User
-from utils import audit_utils
+from utils import audit_utils, custom_json
 
+_OUTPUT_EVENT_PREFIX = b'{"event": "output", "data": '
 
+
+# returns UTF-8 bytes, which tornado sends as a text message without re-encoding
 def wrap_to_server_event(event_type, data):
-    return json.dumps({
+    if (event_type == 'output') and isinstance(data, str):
+        # script output is the most frequent event, so only the text itself is encoded
+        return _OUTPUT_EVENT_PREFIX + custom_json.dumps_bytes(data) + b'}'
+
+    return custom_json.dumps_bytes({
         'event': event_type,
         'data': data
     })